@@ -5,8 +5,7 @@ Usage:
 """
 
 import argparse
-import os
-import sys
+from pathlib import Path
 
 CLIENT_TSP = """\
 import "@typespec/http";
@@ -37,6 +36,9 @@ options:
    flavor: azure
 """
 
+CLIENT_TSP_BYTES = CLIENT_TSP.encode("utf-8")
+TSPCONFIG_YAML_BYTES = TSPCONFIG_YAML.encode("utf-8")
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -53,18 +55,16 @@ examples:
     parser.add_argument("typespec_repo_path", type=str, help="Path to the root of the TypeSpec repository")
     args = parser.parse_args()
 
-    typespec_path = args.typespec_repo_path
-    alpha_dir = os.path.join(typespec_path, "alpha")
-    os.makedirs(alpha_dir, exist_ok=True)
+    alpha_dir = Path(args.typespec_repo_path) / "alpha"
+    alpha_dir.mkdir(parents=True, exist_ok=True)
 
-    client_tsp_path = os.path.join(alpha_dir, "client.tsp")
-    with open(client_tsp_path, "w", newline="\n") as f:
-        f.write(CLIENT_TSP)
+    # Write pre-encoded bytes so no text-mode newline translation happens
+    client_tsp_path = alpha_dir / "client.tsp"
+    client_tsp_path.write_bytes(CLIENT_TSP_BYTES)
     print(f"Created {client_tsp_path}")
 
-    tspconfig_path = os.path.join(alpha_dir, "tspconfig.yaml")
-    with open(tspconfig_path, "w", newline="\n") as f:
-        f.write(TSPCONFIG_YAML)
+    tspconfig_path = alpha_dir / "tspconfig.yaml"
+    tspconfig_path.write_bytes(TSPCONFIG_YAML_BYTES)
     print(f"Created {tspconfig_path}")
 
     print("Done!")
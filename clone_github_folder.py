@@ -15,8 +15,12 @@ import os
 import sys
 import re
 import shutil
+import stat
 import subprocess
 import tempfile
+from pathlib import Path
+
+_GITHUB_URL_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)/(tree|blob)/([^/]+)/(.+)")
 
 
 def parse_github_url(url):
@@ -27,8 +31,7 @@ def parse_github_url(url):
     - https://github.com/{owner}/{repo}/tree/{ref}/{path}
     - https://github.com/{owner}/{repo}/blob/{ref}/{path}
     """
-    pattern = r"https://github\.com/([^/]+)/([^/]+)/(tree|blob)/([^/]+)/(.+)"
-    match = re.match(pattern, url)
+    match = _GITHUB_URL_RE.match(url)
 
     if not match:
         raise ValueError(f"Invalid GitHub URL format: {url}")
@@ -46,14 +49,41 @@ def get_folder_name(path):
     return path.rstrip("/").split("/")[-1]
 
 
+def is_commit_sha(ref):
+    """Check whether the ref is a full 40-character commit SHA rather than a branch/tag name."""
+    return len(ref) == 40 and all(c in "0123456789abcdef" for c in ref.lower())
+
+
 def run_git_command(args, cwd=None, check=True):
-    """Run a git command and return the result."""
-    result = subprocess.run(["git"] + args, cwd=cwd, capture_output=True, text=True)
+    """Run a git command, streaming its combined output line by line, and return the result."""
+    cmd = ["git"] + args
+    proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+    captured = []
+    for line in proc.stdout:
+        sys.stdout.write(line)
+        captured.append(line)
+    returncode = proc.wait()
+    result = subprocess.CompletedProcess(cmd, returncode, stdout="".join(captured), stderr="")
     if check and result.returncode != 0:
-        raise RuntimeError(f"Git command failed: git {' '.join(args)}\n{result.stderr}")
+        raise RuntimeError(f"Git command failed: git {' '.join(args)}\n{result.stdout}")
     return result
 
 
+def _fast_rmtree(path):
+    """Remove a directory tree using os.scandir, clearing read-only bits (git objects) on demand."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except PermissionError:
+                    os.chmod(entry.path, stat.S_IWRITE)
+                    os.unlink(entry.path)
+    os.rmdir(path)
+
+
 def clone_github_folder(url, output_dir=None):
     """
     Clone a specific folder from GitHub using git sparse-checkout.
@@ -75,58 +105,86 @@ def clone_github_folder(url, output_dir=None):
     print()
 
     # Determine destination directory
-    if output_dir:
-        dest_dir = os.path.abspath(output_dir)
-    else:
-        dest_dir = os.getcwd()
-
-    final_dest = os.path.join(dest_dir, folder_name)
+    dest_dir = Path(output_dir).resolve() if output_dir else Path.cwd()
+    final_dest = dest_dir / folder_name
 
     # Check if destination already exists
-    if os.path.exists(final_dest):
+    if final_dest.exists():
         print(f"Warning: {final_dest} already exists. Removing...")
         shutil.rmtree(final_dest)
 
     # Create a temporary directory for the sparse checkout
-    temp_dir = tempfile.mkdtemp(prefix="github_clone_")
+    temp_dir = Path(tempfile.mkdtemp(prefix="github_clone_"))
 
     try:
         print(f"Using temporary directory: {temp_dir}")
         print("-" * 50)
 
-        # Initialize a new git repository
-        print("Initializing git repository...")
-        run_git_command(["init"], cwd=temp_dir)
-
-        # Add the remote
-        print("Adding remote...")
-        run_git_command(["remote", "add", "origin", repo_url], cwd=temp_dir)
-
-        # Enable sparse-checkout
-        print("Enabling sparse-checkout...")
-        run_git_command(["config", "core.sparseCheckout", "true"], cwd=temp_dir)
-
-        # Configure sparse-checkout to only include our target path
-        print(f"Setting sparse-checkout path: {path}")
-        sparse_checkout_file = os.path.join(temp_dir, ".git", "info", "sparse-checkout")
-        os.makedirs(os.path.dirname(sparse_checkout_file), exist_ok=True)
-        with open(sparse_checkout_file, "w") as f:
-            f.write(f"{path}\n")
-
-        # Fetch only the specific ref with depth 1 (shallow clone)
-        print(f"Fetching ref: {ref} (shallow clone)...")
-        run_git_command(["fetch", "--depth", "1", "origin", ref], cwd=temp_dir)
+        # Cone mode for folders, pattern mode when the URL points at a single file
+        cone_flag = "--no-cone" if "/blob/" in url else "--cone"
+
+        # Deeply nested paths only need a handful of trees, so skip all trees up front (treeless clone)
+        # and let git fetch the ones on the path lazily; otherwise skip only the blobs
+        clone_filter = "--filter=tree:0" if len(path.split("/")) > 3 else "--filter=blob:none"
+
+        if is_commit_sha(ref):
+            # `git clone --branch` only accepts branch/tag names, so fetch the commit by SHA
+            print("Initializing git repository...")
+            run_git_command(["init"], cwd=temp_dir)
+            run_git_command(["remote", "add", "origin", repo_url], cwd=temp_dir)
+
+            print(f"Setting sparse-checkout path: {path}")
+            run_git_command(["sparse-checkout", "set", cone_flag, path], cwd=temp_dir)
+
+            # Fetch only the specific commit with depth 1 (shallow partial clone) into a local ref via
+            # an explicit refspec, so the server only negotiates that single object
+            print(f"Fetching ref: {ref} (shallow partial clone)...")
+            checkout_target = "refs/_tmp/clone"
+            run_git_command(
+                [
+                    "-c",
+                    "protocol.version=2",
+                    "fetch",
+                    "--depth=1",
+                    "--no-tags",
+                    clone_filter,
+                    "origin",
+                    f"+{ref}:{checkout_target}",
+                ],
+                cwd=temp_dir,
+            )
+        else:
+            # Shallow, sparse partial clone of the branch/tag in a single git process
+            print(f"Cloning ref: {ref} (shallow partial clone)...")
+            run_git_command(
+                [
+                    "clone",
+                    clone_filter,
+                    "--depth=1",
+                    "--no-checkout",
+                    "--sparse",
+                    "--single-branch",
+                    "--no-tags",
+                    f"--branch={ref}",
+                    repo_url,
+                    str(temp_dir),
+                ]
+            )
+
+            print(f"Setting sparse-checkout path: {path}")
+            run_git_command(["sparse-checkout", "set", cone_flag, path], cwd=temp_dir)
+            checkout_target = ref
 
         # Checkout the fetched ref
         print("Checking out files...")
-        run_git_command(["checkout", "FETCH_HEAD"], cwd=temp_dir)
+        run_git_command(["checkout", checkout_target], cwd=temp_dir)
 
         print("-" * 50)
 
         # Move the target folder to the destination
-        source_path = os.path.join(temp_dir, path)
+        source_path = temp_dir / path
 
-        if not os.path.exists(source_path):
+        if not source_path.exists():
             raise RuntimeError(f"Target folder not found: {source_path}")
 
         print(f"Moving {folder_name} to {dest_dir}...")
@@ -136,9 +194,7 @@ def clone_github_folder(url, output_dir=None):
         print(f"Successfully cloned '{folder_name}' to {final_dest}")
 
         # Update tspconfig.yaml if it exists
-        from pathlib import Path
-
-        tspconfig_path = Path(final_dest) / "tspconfig.yaml"
+        tspconfig_path = final_dest / "tspconfig.yaml"
         if tspconfig_path.exists():
             content = tspconfig_path.read_text(encoding="utf-8")
             content = content.replace("@azure-tools/typespec-python", "@typespec/http-client-python")
@@ -148,12 +204,12 @@ def clone_github_folder(url, output_dir=None):
         # Clean up temporary directory
         print("Cleaning up temporary files...")
         try:
-            shutil.rmtree(temp_dir)
+            _fast_rmtree(temp_dir)
         except Exception:
             pass
 
         print(" === Run the following command to compile the typespec file: === ")
-        final_dest_posix = Path(final_dest).as_posix()
+        final_dest_posix = final_dest.as_posix()
         print(
             f"tsp compile {final_dest_posix}/client.tsp --emit @typespec/http-client-python --config {final_dest_posix}/tspconfig.yaml"
         )
@@ -164,7 +220,7 @@ def clone_github_folder(url, output_dir=None):
         print(f"Error: {e}")
         # Clean up temporary directory on error
         try:
-            shutil.rmtree(temp_dir)
+            _fast_rmtree(temp_dir)
         except Exception:
             pass
         return False
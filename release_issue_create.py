@@ -8,22 +8,29 @@ applies labels, cleans up bot comments, and reopens if auto-closed.
 """
 
 import argparse
+import base64
+import http.client
 import json
+import os
 import subprocess
 import sys
-import webbrowser
 from datetime import datetime, timedelta
+from urllib.parse import unquote, urlsplit, urlunsplit
+from urllib.request import getproxies, proxy_bypass
 
 
 REST_REPO = "Azure/azure-rest-api-specs"
 ISSUE_REPO = "Azure/sdk-release-request"
 LABELS = "ManagementPlane,Python,assigned,auto-link,auto-ask-check"
+ASSIGNEE = "ChenxiJiang333"
+GITHUB_API_HOST = "api.github.com"
+BOT_LOGINS = ("github-actions[bot]", "github-actions")
 
 
-def run_command(cmd: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
-    print(f"  Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+def run_command(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
+    """Run a command directly (no intermediate shell) and return the result."""
+    print(f"  Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd, capture_output=True, text=True)
     if result.stdout:
         print(result.stdout.strip())
     if result.stderr:
@@ -33,10 +40,84 @@ def run_command(cmd: str, check: bool = True) -> subprocess.CompletedProcess:
     return result
 
 
+def get_gh_token() -> str:
+    """Get a GitHub token from the gh CLI so REST calls reuse the existing `gh auth login`."""
+    result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError("Failed to get GitHub token. Run 'gh auth login' first.\n" + result.stderr)
+    return result.stdout.strip()
+
+
+class GitHubSession:
+    """Minimal GitHub REST client that sends every call over one keep-alive HTTPS connection."""
+
+    def __init__(self, token: str):
+        self._conn = self._connect()
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "release-issue-create",
+        }
+
+    @staticmethod
+    def _connect() -> http.client.HTTPSConnection:
+        """Open the API connection, tunnelling through HTTPS_PROXY/https_proxy (like gh does) when one is set."""
+        proxy = getproxies().get("https")
+        if not proxy or proxy_bypass(GITHUB_API_HOST):
+            return http.client.HTTPSConnection(GITHUB_API_HOST, timeout=30)
+
+        proxy_url = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        conn = http.client.HTTPSConnection(proxy_url.hostname, proxy_url.port or 80, timeout=30)
+        tunnel_headers = {}
+        if proxy_url.username:
+            credentials = f"{unquote(proxy_url.username)}:{unquote(proxy_url.password or '')}"
+            tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode()
+        conn.set_tunnel(GITHUB_API_HOST, 443, headers=tunnel_headers)
+        return conn
+
+    def request(self, method: str, path: str, body: dict | None = None):
+        """Send a request and return the decoded JSON response (None for empty bodies)."""
+        print(f"  {method} https://{GITHUB_API_HOST}{path}")
+        headers = dict(self._headers)
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        try:
+            status, payload = self._send(method, path, data, headers)
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            # The server dropped the idle keep-alive connection before answering; reconnect once. Timeouts and
+            # other errors are not retried, since the request (e.g. creating the issue) may already have been applied
+            status, payload = self._send(method, path, data, headers)
+
+        if status >= 400:
+            raise RuntimeError(
+                f"GitHub API {method} {path} failed with status {status}: {payload.decode('utf-8', 'replace')}"
+            )
+        return json.loads(payload) if payload else None
+
+    def _send(self, method: str, path: str, data: bytes | None, headers: dict) -> tuple[int, bytes]:
+        """Do one request/response exchange on the shared connection and return (status, body)."""
+        try:
+            self._conn.request(method, path, body=data, headers=headers)
+            response = self._conn.getresponse()
+            return response.status, response.read()
+        except Exception:
+            # A half-finished exchange (e.g. a timeout) leaves the connection unusable; close it so the next
+            # call reconnects instead of failing with CannotSendRequest
+            self._conn.close()
+            raise
+
+    def close(self) -> None:
+        self._conn.close()
+
+
 def show_issue_link_window(issue_url: str) -> None:
     """Display a window with a clickable issue hyperlink."""
     try:
         import tkinter as tk
+        import webbrowser
         from tkinter import font as tkfont
 
         root = tk.Tk()
@@ -80,9 +161,24 @@ def search_readme_python(package_name: str) -> str:
     """
     print(f"\n[Step 1] Searching for readme.python.md containing '{package_name}'...")
 
-    # Use GitHub search API via gh CLI to find readme.python.md files containing the package name
+    # Use GitHub search API via gh CLI to find readme.python.md files containing the package name.
+    # The path qualifier keeps matches under specification/ server-side.
     result = run_command(
-        f'gh search code "{package_name}" --repo {REST_REPO} --filename readme.python.md --json path,repository --limit 20'
+        [
+            "gh",
+            "search",
+            "code",
+            package_name,
+            "path:specification",
+            "--repo",
+            REST_REPO,
+            "--filename",
+            "readme.python.md",
+            "--json",
+            "path,repository",
+            "--limit",
+            "20",
+        ]
     )
 
     items = json.loads(result.stdout.strip())
@@ -106,26 +202,22 @@ def search_readme_python(package_name: str) -> str:
     return readme_url
 
 
-def extract_service_name(readme_url: str) -> str:
+def parse_readme_url(readme_url: str) -> tuple[str, str]:
     """
-    Extract the SERVICE-NAME from the readme URL.
-    SERVICE-NAME is the path segment right after 'specification/'.
+    Parse the readme URL once and return (SERVICE-NAME, target URL).
+    SERVICE-NAME is the path segment right after 'specification/';
+    the target URL is the parent directory of the readme.
     """
-    parts = readme_url.split("/")
+    url = urlsplit(readme_url)
+    parts = url.path.strip("/").split("/")
     try:
-        spec_idx = parts.index("specification")
-        service_name = parts[spec_idx + 1]
+        service_name = parts[parts.index("specification") + 1]
     except (ValueError, IndexError):
         raise RuntimeError(f"Could not extract service name from URL: {readme_url}")
+    target_url = urlunsplit((url.scheme, url.netloc, "/" + "/".join(parts[:-1]), "", ""))
     print(f"  Service name: {service_name}")
-    return service_name
-
-
-def get_target_url(readme_url: str) -> str:
-    """Get the parent directory of the readme URL."""
-    target_url = readme_url.rsplit("/", 1)[0]
     print(f"  Target URL: {target_url}")
-    return target_url
+    return service_name, target_url
 
 
 def build_issue_title(service_name: str) -> str:
@@ -151,87 +243,56 @@ def build_issue_body(target_url: str, tag: str, service_name: str, current_date:
     return body
 
 
-def create_issue(title: str, body: str) -> str:
-    """Create a GitHub issue and return the issue URL."""
-    print(f"\n[Step 4] Creating issue under {ISSUE_REPO}...")
-    cmd = [
-        "gh",
-        "issue",
-        "create",
-        "--repo",
-        ISSUE_REPO,
-        "--title",
-        title,
-        "--body",
-        body,
-        "--assignee",
-        "ChenxiJiang333",
-    ]
-    print(f'  Running: gh issue create --repo {ISSUE_REPO} --title "{title}" --body <body>')
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.stderr:
-        print(result.stderr.strip(), file=sys.stderr)
-    if result.returncode != 0:
-        raise RuntimeError(f"Command failed with return code {result.returncode}")
-    issue_url = result.stdout.strip().splitlines()[-1]
+def create_issue(session: GitHubSession, title: str, body: str) -> str:
+    """Create a GitHub issue with its assignee and labels, and return the issue URL."""
+    print(f"\n[Step 4] Creating issue under {ISSUE_REPO} with labels: {LABELS}...")
+    issue = session.request(
+        "POST",
+        f"/repos/{ISSUE_REPO}/issues",
+        {
+            "title": title,
+            "body": body,
+            "assignees": [ASSIGNEE],
+            "labels": [l.strip() for l in LABELS.split(",")],
+        },
+    )
+    issue_url = issue["html_url"]
     print(f"  Issue created: {issue_url}")
     return issue_url
 
 
-def add_labels(issue_url: str) -> None:
-    """Add labels to the created issue."""
-    print(f"\n[Step 5] Adding labels: {LABELS}...")
-    # Extract issue number from URL
-    issue_number = issue_url.rstrip("/").split("/")[-1]
-    label_args = " ".join(f'--add-label "{l.strip()}"' for l in LABELS.split(","))
-    run_command(f"gh issue edit {issue_number} --repo {ISSUE_REPO} {label_args}")
-    print("  Labels added.")
-
-
-def delete_bot_comments(issue_url: str) -> None:
+def delete_bot_comments(session: GitHubSession, issue_url: str) -> None:
     """Delete comments from github-actions bot on the issue."""
-    print("\n[Step 6] Deleting github-actions bot comments...")
+    print("\n[Step 5] Deleting github-actions bot comments...")
     issue_number = issue_url.rstrip("/").split("/")[-1]
 
-    # List comments on the issue
-    result = run_command(
-        f'gh api repos/{ISSUE_REPO}/issues/{issue_number}/comments --jq \'.[] | select(.user.login == "github-actions[bot]" or .user.login == "github-actions") | .id\'',
-        check=False,
-    )
-
-    comment_ids = result.stdout.strip().splitlines()
-    if not comment_ids or comment_ids == [""]:
+    # List comments on the issue; cleanup is best-effort, so a failure must not skip the reopen step
+    try:
+        comments = session.request("GET", f"/repos/{ISSUE_REPO}/issues/{issue_number}/comments?per_page=100")
+    except (RuntimeError, OSError, http.client.HTTPException) as e:
+        print(f"  Warning: could not list comments: {e}", file=sys.stderr)
+        return
+    comment_ids = [c["id"] for c in comments if c.get("user", {}).get("login") in BOT_LOGINS]
+    if not comment_ids:
         print("  No github-actions comments found.")
         return
 
     for cid in comment_ids:
-        cid = cid.strip()
-        if cid:
-            print(f"  Deleting comment {cid}...")
-            run_command(
-                f"gh api repos/{ISSUE_REPO}/issues/comments/{cid} -X DELETE",
-                check=False,
-            )
+        print(f"  Deleting comment {cid}...")
+        try:
+            session.request("DELETE", f"/repos/{ISSUE_REPO}/issues/comments/{cid}")
+        except (RuntimeError, OSError, http.client.HTTPException) as e:
+            print(f"  Warning: {e}", file=sys.stderr)
     print("  Bot comments deleted.")
 
 
-def reopen_if_closed(issue_url: str) -> None:
-    """Check if the issue was auto-closed and reopen it."""
-    print("\n[Step 7] Checking if issue is still open...")
+def reopen_if_closed(session: GitHubSession, issue_url: str) -> None:
+    """Make sure the issue is open, reopening it if it was auto-closed."""
+    print("\n[Step 6] Ensuring issue is open...")
     issue_number = issue_url.rstrip("/").split("/")[-1]
 
-    result = run_command(f"gh issue view {issue_number} --repo {ISSUE_REPO} --json state")
-    state_info = json.loads(result.stdout.strip())
-    state = state_info.get("state", "OPEN")
-
-    if state != "OPEN":
-        print(f"  Issue is {state}. Reopening...")
-        run_command(f"gh issue reopen {issue_number} --repo {ISSUE_REPO}")
-        print("  Issue reopened.")
-    else:
-        print("  Issue is already open.")
+    issue = session.request("PATCH", f"/repos/{ISSUE_REPO}/issues/{issue_number}", {"state": "open"})
+    print(f"  Issue is {issue['state']}.")
 
 
 def main():
@@ -242,6 +303,7 @@ def main():
 examples:
   python release_issue_create.py --sdk-name <package-name> --tag <readme-tag>
   python release_issue_create.py --sdk-name managementgroups --tag package-2021-04
+  python release_issue_create.py --sdk-name managementgroups --tag package-2021-04 --no-gui
 """,
     )
     parser.add_argument(
@@ -254,6 +316,7 @@ examples:
         required=True,
         help="The readme tag for the release.",
     )
+    parser.add_argument("--no-gui", action="store_true", help="Disable GUI popup (for automated/headless usage)")
     args = parser.parse_args()
 
     package_name = args.sdk_name
@@ -268,28 +331,32 @@ examples:
     readme_url = search_readme_python(package_name)
 
     # Step 2: Extract service name and target URL
-    service_name = extract_service_name(readme_url)
-    target_url = get_target_url(readme_url)
+    service_name, target_url = parse_readme_url(readme_url)
 
     # Step 3-4: Build issue title and body
     title = build_issue_title(service_name)
     body = build_issue_body(target_url, tag, service_name, current_date)
 
-    # Step 5: Create the issue
-    issue_url = create_issue(title, body)
-
-    # Step 6: Add labels
-    add_labels(issue_url)
+    # Steps 5-7 share one authenticated keep-alive connection to the GitHub REST API
+    session = GitHubSession(get_gh_token())
+    try:
+        # Step 5: Create the issue (labels and assignee are applied on creation)
+        issue_url = create_issue(session, title, body)
 
-    # Step 7: Delete github-actions bot comments
-    delete_bot_comments(issue_url)
+        # Step 6: Delete github-actions bot comments
+        delete_bot_comments(session, issue_url)
 
-    # Step 8: Reopen if closed
-    reopen_if_closed(issue_url)
+        # Step 7: Reopen if closed
+        reopen_if_closed(session, issue_url)
+    finally:
+        session.close()
 
-    # Step 9: Show the issue link
+    # Step 8: Show the issue link
     print(f"\n✅ Issue URL: {issue_url}")
-    show_issue_link_window(issue_url)
+    # Skip the blocking Tk window in CI or when output is not an interactive terminal
+    headless = args.no_gui or os.environ.get("NO_GUI") or os.environ.get("CI") or not sys.stdout.isatty()
+    if not headless:
+        show_issue_link_window(issue_url)
 
 
 if __name__ == "__main__":
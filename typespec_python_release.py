@@ -7,75 +7,98 @@ for the Azure/autorest.python repository.
 """
 
 import argparse
+import functools
+import http.client
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import time
+import urllib.parse
+import urllib.request
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-
-def show_pr_link_window(pr_url: str) -> None:
-    """Display a window with a clickable PR hyperlink."""
-    try:
-        import tkinter as tk
-        from tkinter import font as tkfont
-
-        root = tk.Tk()
-        root.title("PR Created Successfully")
-        root.geometry("500x120")
-        root.resizable(False, False)
-
-        # Center the window on screen
-        root.update_idletasks()
-        x = (root.winfo_screenwidth() // 2) - (500 // 2)
-        y = (root.winfo_screenheight() // 2) - (120 // 2)
-        root.geometry(f"+{x}+{y}")
-
-        # Keep window on top
-        root.attributes("-topmost", True)
-
-        # Label
-        label = tk.Label(root, text="PR created successfully! Click the link below:", pady=10)
-        label.pack()
-
-        # Hyperlink label
-        link_font = tkfont.Font(family="TkDefaultFont", underline=True)
-        link_label = tk.Label(root, text=pr_url, fg="blue", cursor="hand2", font=link_font)
-        link_label.pack(pady=5)
-
-        def open_link(event=None):
-            webbrowser.open(pr_url)
-            root.destroy()
-
-        link_label.bind("<Button-1>", open_link)
-
-        # Close button
-        close_btn = tk.Button(root, text="Close", command=root.destroy, width=10)
-        close_btn.pack(pady=10)
-
-        root.mainloop()
-
-    except ImportError:
-        print(f"\nPR URL: {pr_url}")
-        print("(tkinter not available - please open the URL manually)")
-
-
-def run_command(cmd: str | list[str], cwd: str | Path | None = None, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
-    if isinstance(cmd, str):
-        print(f"  Running: {cmd}")
-        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is used when it isn't installed
+    orjson = None
+
+CACHE_DIR = Path.home() / ".cache" / "typespec_python_release"
+PREREQ_CACHE = CACHE_DIR / "prereq.json"
+PREREQ_CACHE_TTL = 24 * 60 * 60
+NPM_REGISTRY = "https://registry.npmjs.org"
+NPM_VERSION_CACHE = CACHE_DIR / "npm-versions.json"
+NPM_VERSION_CACHE_TTL = 10 * 60
+# Cleared by --no-cache: cached versions are then ignored (but fresh lookups still refresh the cache)
+_read_cached_npm_versions = True
+
+# The flat "dependencies" / "devDependencies" objects of a package.json (peerDependencies etc. are left alone)
+_DEPENDENCY_BLOCK_RE = re.compile(r'"(?:dependencies|devDependencies)"\s*:\s*\{[^{}]*\}')
+# Matches the @typespec/http-client-python entry inside one of those blocks
+_HTTP_CLIENT_PYTHON_DEP_RE = re.compile(r'("@typespec/http-client-python"\s*:\s*)"([^"]*)"')
+# Peer dependency ranges, in one pass: ">=0.a.b <1.0.0" (range_lo/range_hi) or "^1.a.b" (caret)
+_PEER_DEP_RE = re.compile(
+    r"^(?:>=(?P<range_lo>0\.\d+\.\d+)\s+(?P<range_hi><\d+\.\d+\.\d+)|\^(?P<caret>\d+\.\d+\.\d+))$"
+)
+_PKG_VERSION_RE = re.compile(r'"version":\s*"(\d+)\.(\d+)\.(\d+)"')
+_CHANGELOG_VERSION_RE = re.compile(r"^## (\d+)\.(\d+)\.(\d+)", re.MULTILINE)
+_PR_URL_RE = re.compile(r"https://github\.com/[^\s]+/pull/\d+")
+
+# Packages released by this script, relative to the repository root
+AUTOREST_DIR = "packages/autorest.python"
+TYPESPEC_DIR = "packages/typespec-python"
+# Files the version tool is expected to change
+RELEASE_FILES = [
+    f"{AUTOREST_DIR}/package.json",
+    f"{AUTOREST_DIR}/CHANGELOG.md",
+    f"{TYPESPEC_DIR}/package.json",
+    f"{TYPESPEC_DIR}/CHANGELOG.md",
+]
+
+
+def show_pr_link(pr_url: str) -> None:
+    """Print the PR URL as a clickable terminal hyperlink and open it in the browser."""
+    if sys.stdout.isatty():
+        # OSC 8 escape sequence: rendered as a clickable link by modern terminals, plain text elsewhere
+        print(f"\n  PR URL: \033]8;;{pr_url}\033\\{pr_url}\033]8;;\033\\")
     else:
-        print(f"  Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+        print(f"\n  PR URL: {pr_url}")
+    # Best effort and non-blocking: hands the URL to the default browser and returns immediately
+    webbrowser.open(pr_url, new=2)
+
+
+def run_command(
+    cmd: list[str],
+    cwd: str | Path | None = None,
+    check: bool = True,
+    pass_through: bool = False,
+    env: dict[str, str] | None = None,
+) -> subprocess.CompletedProcess:
+    """Run a command directly (no intermediate shell) and return the result.
+
+    With pass_through=True the child inherits stdout/stderr instead of being captured, which suits
+    long-running steps (installs, builds, pushes) whose output is only echoed and never parsed.
+    """
+    # None inherits the parent's file descriptors; PIPE captures for callers that parse the output
+    stream = None if pass_through else subprocess.PIPE
+    print(f"  Running: {' '.join(cmd)}")
+
+    # Resolve the executable up front so Windows .cmd shims (npm, pnpm, npx) start without a shell
+    cmd = [shutil.which(cmd[0]) or cmd[0], *cmd[1:]]
+    result = subprocess.run(cmd, cwd=cwd, env=env, stdout=stream, stderr=stream, text=True)
 
+    # Echo captured output as-is: write() skips print()'s extra newline and separator handling.
+    # Passed-through output was already shown by the child, so stdout/stderr are None here
     if result.stdout:
-        print(result.stdout)
+        sys.stdout.write(result.stdout if result.stdout.endswith("\n") else result.stdout + "\n")
+        sys.stdout.flush()
     if result.stderr:
-        print(result.stderr, file=sys.stderr)
+        sys.stderr.write(result.stderr if result.stderr.endswith("\n") else result.stderr + "\n")
 
     if check and result.returncode != 0:
         raise RuntimeError(f"Command failed with return code {result.returncode}")
@@ -83,89 +106,265 @@ def run_command(cmd: str | list[str], cwd: str | Path | None = None, check: bool
     return result
 
 
-def prepare_branch(repo_path: Path, base_branch: str, current_date: str) -> None:
+class GitRunner:
+    """Runs git commands in one repository with a working directory and environment built once."""
+
+    def __init__(self, cwd: Path):
+        self.cwd = cwd
+        # Skip optional index.lock refreshes (e.g. by status/diff) and fail instead of hanging on a credential prompt
+        self.env = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "GIT_TERMINAL_PROMPT": "0"}
+
+    def run(self, *args: str, check: bool = True, pass_through: bool = False) -> subprocess.CompletedProcess:
+        """Run `git <args>` directly (no intermediate shell) and return the result."""
+        return run_command(["git", *args], cwd=self.cwd, check=check, pass_through=pass_through, env=self.env)
+
+
+def prepare_branch(git: GitRunner, base_branch: str, current_date: str) -> None:
     """Prepare the working branch based on BASE_BRANCH."""
     print("\n[Step 1] Preparing branch...")
 
-    run_command("git reset HEAD", cwd=repo_path, check=False)
-    run_command("git checkout .", cwd=repo_path)
+    # Unstage everything first so newly added files survive as untracked files, then discard tracked edits
+    git.run("reset", "-q", "HEAD", check=False)
+    git.run("restore", "--", ":/")
 
     if base_branch == "main":
-        run_command("git checkout origin/main", cwd=repo_path)
-        run_command("git pull origin main", cwd=repo_path)
         branch_name = f"publish/release-{current_date}"
-        run_command(f"git checkout -b {branch_name}", cwd=repo_path)
+        git.run("checkout", "origin/main")
+        git.run("pull", "origin", "main")
+        git.run("checkout", "-b", branch_name)
         print(f"  Created branch: {branch_name}")
     else:
-        run_command(f"git fetch origin {base_branch}", cwd=repo_path)
-        run_command(f"git checkout {base_branch}", cwd=repo_path)
+        git.run("fetch", "origin", base_branch)
+        git.run("checkout", base_branch)
         print(f"  Checked out branch: {base_branch}")
 
 
+def _read_npm_version_cache() -> dict[str, dict]:
+    """Read the on-disk npm version cache, treating a missing or malformed file (or entry) as a miss."""
+    try:
+        cache = json.loads(NPM_VERSION_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {
+        name: entry
+        for name, entry in cache.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("version"), str)
+        and isinstance(entry.get("fetched_at"), (int, float))
+    }
+
+
+def _load_npm_version_cache() -> dict[str, str]:
+    """Load the still-fresh entries of the on-disk npm version cache as {package: version}."""
+    if not _read_cached_npm_versions:
+        return {}
+    now = time.time()
+    return {
+        name: entry["version"]
+        for name, entry in _read_npm_version_cache().items()
+        if now - entry["fetched_at"] < NPM_VERSION_CACHE_TTL
+    }
+
+
+def _store_npm_versions(versions: dict[str, str]) -> None:
+    """Record freshly resolved package versions in the on-disk npm version cache."""
+    if not versions:
+        return
+    cache = _read_npm_version_cache()
+    now = time.time()
+    cache.update({name: {"version": version, "fetched_at": now} for name, version in versions.items()})
+    # The cache is best-effort: an unwritable cache directory must not fail the release
+    try:
+        NPM_VERSION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _write_bytes_atomic(NPM_VERSION_CACHE, json.dumps(cache, indent=2).encode("utf-8"))
+    except OSError:
+        pass
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write to a sibling temp file and swap it in, so a concurrent or interrupted run never leaves a torn file."""
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, path)
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_latest_version(package_name: str) -> str | None:
+    """Get the latest version of a package straight from the npm registry, or None on failure."""
+    # The abbreviated ("corgi") manifest still carries dist-tags but is far smaller than the full document
+    request = urllib.request.Request(
+        f"{NPM_REGISTRY}/{urllib.parse.quote(package_name, safe='@')}",
+        headers={"Accept": "application/vnd.npm.install-v1+json", "User-Agent": "typespec-python-release"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.load(response)["dist-tags"]["latest"]
+    except (OSError, ValueError, KeyError, http.client.HTTPException):
+        return None
+
+
+def _fetch_latest_versions(package_names: list[str]) -> dict[str, str]:
+    """Fetch the latest versions of several packages concurrently; packages that fail are omitted."""
+    cached = _load_npm_version_cache()
+    versions = {name: cached[name] for name in package_names if name in cached}
+    missing = [name for name in package_names if name not in versions]
+    if not missing:
+        return versions
+
+    with ThreadPoolExecutor(max_workers=min(16, len(missing))) as executor:
+        fetched = dict(zip(missing, executor.map(_fetch_latest_version, missing)))
+    fetched = {name: version for name, version in fetched.items() if version}
+    _store_npm_versions(fetched)
+    versions.update(fetched)
+    return versions
+
+
 def get_latest_npm_version(package_name: str) -> str:
     """Get the latest version of a package from npm."""
     print(f"\n[Step 2a] Getting latest version of {package_name}...")
 
-    result = run_command(f"npm view {package_name} version")
-    version = result.stdout.strip()
+    version = _load_npm_version_cache().get(package_name)
+    if version:
+        print(f"  Latest version: {version} (cached)")
+        return version
+
+    # Ask the registry directly instead of starting Node.js for npm view; keep npm view as the fallback
+    # since it honours the user's npm configuration (proxies, custom registries)
+    version = _fetch_latest_version(package_name) or _npm_view_version(package_name, check=True)
     print(f"  Latest version: {version}")
+    _store_npm_versions({package_name: version})
 
     return version
 
 
-def update_http_client_python_dependency(repo_path: Path, version: str) -> None:
-    """Update @typespec/http-client-python version in package.json files."""
-    print("\n[Step 2b] Updating @typespec/http-client-python dependency...")
+def _npm_view_version(package_name: str, check: bool = False) -> str | None:
+    """Get the latest version of a package with `npm view`, or None on failure (unless check is set)."""
+    result = run_command(["npm", "view", package_name, "version", "--json"], check=check)
+    if result.returncode != 0:
+        return None
+    try:
+        version = json.loads(result.stdout)
+    except ValueError:
+        if check:
+            raise
+        return None
+    return version if isinstance(version, str) else None
 
-    package_files = [
-        repo_path / "packages" / "autorest.python" / "package.json",
-        repo_path / "packages" / "typespec-python" / "package.json",
-    ]
+
+def _sub_in_file(path: Path, pattern: re.Pattern, repl, count: int = 0) -> list[re.Match]:
+    """Apply a regex substitution to a text file in place and return the matches that were replaced.
+
+    Only the matched text is edited instead of a full parse/serialize round-trip, so formatting, key order and
+    line endings are preserved, and the file is only rewritten when something actually changed.
+    """
+    # Decoding raw bytes leaves line endings untouched, like newline="" would
+    content = path.read_bytes().decode("utf-8")
+
+    # Record each match from inside the substitution so the file is scanned once
+    matches = []
+
+    def record(match: re.Match) -> str:
+        matches.append(match)
+        return repl(match) if callable(repl) else match.expand(repl)
+
+    new_content = pattern.sub(record, content, count=count)
+
+    if new_content != content:
+        _write_bytes_atomic(path, new_content.encode("utf-8"))
+    return matches
+
+
+def update_http_client_python_dependency(repo_path: Path, package_files: list[Path], version: str) -> None:
+    """Update @typespec/http-client-python version in the given (already validated) package.json files."""
+    print("\n[Step 2b] Updating @typespec/http-client-python dependency...")
 
     new_version = f"~{version}"
 
+    replacement = rf'\g<1>"{new_version}"'
     for package_file in package_files:
-        if not package_file.exists():
-            raise RuntimeError(f"Package file not found: {package_file}")
+        rel_path = package_file.relative_to(repo_path)
+        updates = []  # (section label, old version)
 
-        with open(package_file, "r", encoding="utf-8") as f:
-            package_data = json.load(f)
+        # Only rewrite the entry inside dependencies/devDependencies, never e.g. a peerDependencies range
+        def update_block(block: re.Match) -> str:
+            label = " (devDependencies)" if block.group(0).startswith('"devDependencies"') else ""
 
-        # Update in dependencies
-        if "dependencies" in package_data and "@typespec/http-client-python" in package_data["dependencies"]:
-            old_version = package_data["dependencies"]["@typespec/http-client-python"]
-            package_data["dependencies"]["@typespec/http-client-python"] = new_version
-            print(f"  {package_file.relative_to(repo_path)}: '{old_version}' -> '{new_version}'")
+            def record(match: re.Match) -> str:
+                updates.append((label, match.group(2)))
+                return match.expand(replacement)
 
-        # Update in devDependencies if present
-        if "devDependencies" in package_data and "@typespec/http-client-python" in package_data["devDependencies"]:
-            old_version = package_data["devDependencies"]["@typespec/http-client-python"]
-            package_data["devDependencies"]["@typespec/http-client-python"] = new_version
-            print(f"  {package_file.relative_to(repo_path)} (devDependencies): '{old_version}' -> '{new_version}'")
+            return _HTTP_CLIENT_PYTHON_DEP_RE.sub(record, block.group(0))
 
-        with open(package_file, "w", encoding="utf-8") as f:
-            json.dump(package_data, f, indent=2)
-            f.write("\n")  # Add trailing newline
+        _sub_in_file(package_file, _DEPENDENCY_BLOCK_RE, update_block)
+        for label, old_version in updates:
+            print(f"  {rel_path}{label}: '{old_version}' -> '{new_version}'")
 
 
 def check_prerequisites() -> None:
     """Verify that npm-check-updates is available."""
     print("\n[Prerequisites] Checking npm-check-updates...")
 
-    result = run_command("npx npm-check-updates --version", check=False)
-    if result.returncode != 0:
-        print("  npm-check-updates not found, installing globally...")
-        run_command("npm install -g npm-check-updates")
-    else:
+    if PREREQ_CACHE.exists() and time.time() - PREREQ_CACHE.stat().st_mtime < PREREQ_CACHE_TTL:
+        print("  npm-check-updates is available (cached)")
+        return
+
+    if shutil.which("npm-check-updates"):
         print("  npm-check-updates is available")
+    else:
+        # Only the exit code matters for this probe, so discard its output (and the npx banner)
+        npx = shutil.which("npx") or "npx"
+        try:
+            returncode = subprocess.run(
+                [npx, "npm-check-updates", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            ).returncode
+        except FileNotFoundError:
+            returncode = 1
+        if returncode != 0:
+            print("  npm-check-updates not found, installing globally...")
+            run_command(["npm", "install", "-g", "npm-check-updates"], pass_through=True)
+        else:
+            print("  npm-check-updates is available")
 
+    # Remembering the result is only an optimization, so an unwritable cache directory is not an error
+    try:
+        PREREQ_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        PREREQ_CACHE.write_text(json.dumps({"npm-check-updates": True}), encoding="utf-8")
+    except OSError:
+        pass
 
-def save_spec_dev_dependencies(repo_path: Path) -> dict[str, str]:
-    """Save original devDependencies versions for spec packages before ncu update."""
-    package_file = repo_path / "packages" / "typespec-python" / "package.json"
 
-    with open(package_file, "r", encoding="utf-8") as f:
-        package_data = json.load(f)
+def _json_loads(data: bytes):
+    """Parse JSON from raw bytes, with orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps_indent(data) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON; both backends produce identical output."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+class PackageJsonCache:
+    """A package.json parsed once, edited in memory by several steps, and written back once if changed."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.data = _json_loads(path.read_bytes())
+        self.dirty = False
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        _write_bytes_atomic(self.path, _json_dumps_indent(self.data) + b"\n")  # Add trailing newline
+        self.dirty = False
+
+
+def save_spec_dev_dependencies(package_file: Path) -> dict[str, str]:
+    """Save original devDependencies versions for spec packages before ncu update."""
+    package_data = _json_loads(package_file.read_bytes())
 
     saved = {}
     dev_deps = package_data.get("devDependencies", {})
@@ -186,69 +385,74 @@ def update_typespec_dependencies(repo_path: Path) -> None:
     """Run npm-check-updates to update @typespec/* and @azure-tools/* dependencies."""
     print("\n[Step 3] Updating @typespec/* and @azure-tools/* dependencies...")
 
+    # Without a shell the filter's "*" reaches ncu as-is instead of being open to filename globbing
     run_command(
-        "npx npm-check-updates -u --filter @typespec/*,@azure-tools/* "
-        "--packageFile packages/typespec-python/package.json",
+        [
+            "npx",
+            "npm-check-updates",
+            "-u",
+            "--filter",
+            "@typespec/*,@azure-tools/*",
+            "--packageFile",
+            f"{TYPESPEC_DIR}/package.json",
+        ],
         cwd=repo_path,
+        pass_through=True,
     )
 
 
-def _get_latest_npm_version_silent(package_name: str) -> str | None:
-    """Get the latest version of a package from npm without verbose output."""
-    result = subprocess.run(
-        f"npm view {package_name} version",
-        shell=True,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return None
+def _updatable_peer_dependencies(peer_deps: dict[str, str]) -> list[str]:
+    """Return the peer dependencies whose range follows a pattern that step 4 knows how to bump."""
+    return [name for name, value in peer_deps.items() if _PEER_DEP_RE.match(value)]
 
 
-def update_peer_dependencies(repo_path: Path) -> None:
+def update_peer_dependencies(package_json: PackageJsonCache) -> None:
     """Update peerDependencies in packages/typespec-python/package.json."""
     print("\n[Step 4] Updating peerDependencies...")
 
-    package_file = repo_path / "packages" / "typespec-python" / "package.json"
-
-    with open(package_file, "r", encoding="utf-8") as f:
-        package_data = json.load(f)
-
-    peer_deps = package_data.get("peerDependencies", {})
+    peer_deps = package_json.data.get("peerDependencies", {})
     if not peer_deps:
         print("  No peerDependencies found")
         return
 
-    for pkg_name, current_value in list(peer_deps.items()):
-        # Pattern 1: ">=0.a.b <1.0.0"
-        range_match = re.match(r"^>=(0\.\d+\.\d+)\s+(<\d+\.\d+\.\d+)$", current_value)
-        if range_match:
-            upper_bound = range_match.group(2)
-            latest = _get_latest_npm_version_silent(pkg_name)
-            if latest:
-                new_value = f">={latest} {upper_bound}"
-                if new_value != current_value:
-                    print(f"  {pkg_name}: '{current_value}' -> '{new_value}'")
-                    peer_deps[pkg_name] = new_value
+    # Look up every peer dependency that follows a known pattern in one parallel batch
+    updatable = _updatable_peer_dependencies(peer_deps)
+    latest_versions = _fetch_latest_versions(updatable)
+
+    # Packages the registry request couldn't resolve fall back to npm view, which honours .npmrc registries/proxies
+    fallback_versions = {}
+    for pkg_name in updatable:
+        if pkg_name in latest_versions:
             continue
+        print(f"  Warning: could not fetch {pkg_name} from {NPM_REGISTRY}, falling back to npm view")
+        version = _npm_view_version(pkg_name)
+        if version:
+            fallback_versions[pkg_name] = version
+        else:
+            print(f"  Warning: could not resolve the latest version of {pkg_name}, leaving it unchanged")
+    _store_npm_versions(fallback_versions)
+    latest_versions.update(fallback_versions)
 
-        # Pattern 2: "^1.a.b"
-        caret_match = re.match(r"^\^(\d+\.\d+\.\d+)$", current_value)
-        if caret_match:
-            latest = _get_latest_npm_version_silent(pkg_name)
-            if latest:
-                new_value = f"^{latest}"
-                if new_value != current_value:
-                    print(f"  {pkg_name}: '{current_value}' -> '{new_value}'")
-                    peer_deps[pkg_name] = new_value
+    for pkg_name, current_value in list(peer_deps.items()):
+        peer_match = _PEER_DEP_RE.match(current_value)
+        latest = latest_versions.get(pkg_name)
+        if not peer_match or not latest:
             continue
 
-    with open(package_file, "w", encoding="utf-8") as f:
-        json.dump(package_data, f, indent=2)
-        f.write("\n")
+        if peer_match.group("caret"):
+            # Pattern 2: "^1.a.b"
+            new_value = f"^{latest}"
+        else:
+            # Pattern 1: ">=0.a.b <1.0.0"
+            new_value = f">={latest} {peer_match.group('range_hi')}"
+
+        if new_value != current_value:
+            print(f"  {pkg_name}: '{current_value}' -> '{new_value}'")
+            peer_deps[pkg_name] = new_value
+            package_json.dirty = True
 
 
+@functools.lru_cache(maxsize=512)
 def _parse_version_tuple(version: str) -> tuple:
     """Parse a version string into a comparable tuple.
 
@@ -275,7 +479,7 @@ def _parse_version_tuple(version: str) -> tuple:
         return (*parts, alpha, 1, 0)
 
 
-def verify_spec_dev_dependencies(repo_path: Path, saved_versions: dict[str, str]) -> None:
+def verify_spec_dev_dependencies(package_json: PackageJsonCache, saved_versions: dict[str, str]) -> None:
     """Verify devDependencies versions for spec packages after ncu update."""
     print("\n[Step 5] Verifying devDependencies versions for specs...")
 
@@ -283,13 +487,7 @@ def verify_spec_dev_dependencies(repo_path: Path, saved_versions: dict[str, str]
         print("  No spec devDependencies to verify")
         return
 
-    package_file = repo_path / "packages" / "typespec-python" / "package.json"
-
-    with open(package_file, "r", encoding="utf-8") as f:
-        package_data = json.load(f)
-
-    dev_deps = package_data.get("devDependencies", {})
-    changed = False
+    dev_deps = package_json.data.get("devDependencies", {})
 
     for pkg_name, original_version in saved_versions.items():
         if pkg_name not in dev_deps:
@@ -304,61 +502,77 @@ def verify_spec_dev_dependencies(repo_path: Path, saved_versions: dict[str, str]
         if _parse_version_tuple(original_version) > _parse_version_tuple(updated_version):
             print(f"  {pkg_name}: keeping original '{original_version}' (newer than updated '{updated_version}')")
             dev_deps[pkg_name] = original_version
-            changed = True
+            package_json.dirty = True
         else:
             print(f"  {pkg_name}: keeping updated '{updated_version}' (step 3 works as expected)")
 
-    if changed:
-        with open(package_file, "w", encoding="utf-8") as f:
-            json.dump(package_data, f, indent=2)
-            f.write("\n")
 
+def run_version_tool(repo_path: Path, git: GitRunner) -> bool:
+    """Run pnpm change version command.
 
-def run_version_tool(repo_path: Path) -> None:
-    """Run pnpm change version command."""
+    Returns True if a CHANGELOG.md gained a '### Features' section, i.e. a minor version bump is needed.
+    """
     print("\n[Step 6] Running version tool...")
 
-    run_command("pnpm change version", cwd=repo_path)
+    run_command(["pnpm", "change", "version"], cwd=repo_path, pass_through=True)
 
-    # Verify expected files are changed
+    # Verify expected files are changed. A single streamed diff of the expected files answers both this and
+    # step 7's question: the "diff --git" headers name the changed files and the added CHANGELOG lines reveal
+    # "### Features". Diffing against HEAD covers staged and unstaged edits like git status did, and
+    # --unified=0 drops context lines at the source. The header format is pinned (a/ and b/ prefixes, no external
+    # diff driver) so diff.noprefix, diff.mnemonicPrefix or diff.external in the user's config can't change it
     print("  Verifying changed files...")
-    result = run_command("git status --porcelain", cwd=repo_path)
-
-    expected_files = [
-        "packages/autorest.python/package.json",
-        "packages/autorest.python/CHANGELOG.md",
-        "packages/typespec-python/package.json",
-        "packages/typespec-python/CHANGELOG.md",
+    cmd = [
+        "git",
+        "diff",
+        "HEAD",
+        "--no-color",
+        "--no-ext-diff",
+        "--src-prefix=a/",
+        "--dst-prefix=b/",
+        "--unified=0",
+        "--",
+        *RELEASE_FILES,
     ]
+    print(f"  Running: {' '.join(cmd)}")
+    print(" === diff output begins ===")
+    changed_paths = set()
+    current_path = ""
+    needs_minor_bump = False
+    with subprocess.Popen(
+        cmd, cwd=git.cwd, env=git.env, stdout=subprocess.PIPE, text=True, encoding="utf-8", errors="replace"
+    ) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            if line.startswith("diff --git a/"):
+                current_path = line[len("diff --git a/") :].split(" b/", 1)[0]
+                changed_paths.add(current_path)
+            elif line.startswith("+") and "### Features" in line and current_path.endswith("CHANGELOG.md"):
+                needs_minor_bump = True
+    print(" === diff output ends ===")
 
-    changed_files = result.stdout.strip().split("\n") if result.stdout.strip() else []
-    changed_count = 0
+    if proc.returncode != 0:
+        raise RuntimeError(f"Command failed with return code {proc.returncode}")
 
-    for expected in expected_files:
-        for changed in changed_files:
-            if expected in changed:
-                changed_count += 1
-                break
+    changed_count = sum(1 for expected in RELEASE_FILES if expected in changed_paths)
 
     print(f"  Found {changed_count}/4 expected files changed")
 
     if changed_count < 4:
         print("  Warning: Less than 4 expected files were changed")
 
+    return needs_minor_bump
 
-def check_and_fix_minor_version(repo_path: Path) -> None:
-    """Check if minor version bump is needed and apply it if necessary."""
-    print("\n[Step 7] Checking for minor version bump...")
 
-    # Run git diff to inspect CHANGELOG.md files
-    result = run_command("git diff", cwd=repo_path)
-    diff_output = result.stdout
-    print(" === diff output begins ===")
-    print(diff_output)
-    print(" === diff output ends ===")
+def _minor_version(match: re.Match) -> str:
+    """Convert a matched (major, minor, patch) version to the next minor version: increment minor, reset patch."""
+    major, minor, _ = match.groups()
+    return f"{major}.{int(minor) + 1}.0"
 
-    # Check if any CHANGELOG.md contains "### Features" in newly added lines only
-    needs_minor_bump = any(line.startswith("+") and "### Features" in line for line in diff_output.splitlines())
+
+def check_and_fix_minor_version(repo_path: Path, needs_minor_bump: bool) -> None:
+    """Apply a minor version bump if the version tool's CHANGELOG entries contain features."""
+    print("\n[Step 7] Checking for minor version bump...")
 
     if not needs_minor_bump:
         print("  No '### Features' found in CHANGELOGs, keeping patch version")
@@ -366,68 +580,39 @@ def check_and_fix_minor_version(repo_path: Path) -> None:
 
     print("  Found '### Features' in CHANGELOG, upgrading to minor version...")
 
-    # Files to update
-    files_to_update = [
-        ("packages/autorest.python/package.json", "version"),
-        ("packages/autorest.python/CHANGELOG.md", "changelog"),
-        ("packages/typespec-python/package.json", "version"),
-        ("packages/typespec-python/CHANGELOG.md", "changelog"),
-    ]
-
-    for rel_path, file_type in files_to_update:
+    for rel_path in RELEASE_FILES:
         file_path = repo_path / rel_path
 
         if not file_path.exists():
             print(f"  Warning: File not found: {file_path}")
             continue
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        if file_type == "version":
-            # Update version in package.json
-            # Match pattern like "version": "1.2.3"
-            version_match = re.search(r'"version":\s*"(\d+)\.(\d+)\.(\d+)"', content)
-            if version_match:
-                major, minor, patch = version_match.groups()
-                old_version = f"{major}.{minor}.{patch}"
-                # Convert patch to minor: increment minor, reset patch to 0
-                new_version = f"{major}.{int(minor) + 1}.0"
-                content = content.replace(f'"version": "{old_version}"', f'"version": "{new_version}"')
-                print(f"  {rel_path}: '{old_version}' -> '{new_version}'")
-
-        elif file_type == "changelog":
-            # Update version in CHANGELOG.md
-            # Match pattern like ## 1.2.3 (date)
-            version_match = re.search(r"## (\d+)\.(\d+)\.(\d+)", content)
-            if version_match:
-                major, minor, patch = version_match.groups()
-                old_version = f"{major}.{minor}.{patch}"
-                new_version = f"{major}.{int(minor) + 1}.0"
-                content = re.sub(rf"## {re.escape(old_version)}", f"## {new_version}", content, count=1)
-                print(f"  {rel_path}: '{old_version}' -> '{new_version}'")
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-
-def build_and_stage(repo_path: Path) -> None:
+        if rel_path.endswith("package.json"):
+            # Update version in package.json, pattern like "version": "1.2.3"
+            pattern, template = _PKG_VERSION_RE, '"version": "{}"'
+        else:
+            # Update version in CHANGELOG.md, pattern like ## 1.2.3 (date)
+            pattern, template = _CHANGELOG_VERSION_RE, "## {}"
+
+        for match in _sub_in_file(file_path, pattern, lambda m: template.format(_minor_version(m)), count=1):
+            print(f"  {rel_path}: '{'.'.join(match.groups())}' -> '{_minor_version(match)}'")
+
+
+def build_and_stage(repo_path: Path, git: GitRunner) -> None:
     """Install dependencies, build, and stage changes."""
     print("\n[Step 8] Installing dependencies and building...")
 
-    run_command("pnpm install", cwd=repo_path)
-    run_command("pnpm build", cwd=repo_path)
+    run_command(["pnpm", "install"], cwd=repo_path, pass_through=True)
+    run_command(["pnpm", "build"], cwd=repo_path, pass_through=True)
+    git.run("add", "-u")
 
-    print("  Staging changes...")
-    run_command("git add -u", cwd=repo_path)
 
-
-def commit_and_push(repo_path: Path) -> None:
+def commit_and_push(git: GitRunner) -> None:
     """Commit and push changes."""
     print("\n[Step 9] Committing and pushing...")
 
-    run_command('git commit -m "bump version"', cwd=repo_path)
-    run_command("git push -u origin HEAD", cwd=repo_path)
+    git.run("commit", "-m", "bump version", pass_through=True)
+    git.run("push", "-u", "origin", "HEAD", pass_through=True)
 
 
 def create_pr_if_needed(repo_path: Path, base_branch: str) -> str | None:
@@ -435,29 +620,26 @@ def create_pr_if_needed(repo_path: Path, base_branch: str) -> str | None:
     print("\n[Step 10] Checking for existing PR...")
 
     # Check if PR already exists for current branch
-    result = run_command("gh pr view --json url", cwd=repo_path, check=False)
+    # gh extracts the URL itself; empty output means there is no PR
+    result = run_command(["gh", "pr", "view", "--json", "url", "--jq", ".url"], cwd=repo_path, check=False)
+    pr_url = result.stdout.strip()
 
-    if result.returncode == 0:
+    if result.returncode == 0 and pr_url:
         # PR already exists
-        try:
-            pr_data = json.loads(result.stdout)
-            pr_url = pr_data.get("url")
-            print(f"  PR already exists: {pr_url}")
-            return pr_url
-        except json.JSONDecodeError:
-            pass
+        print(f"  PR already exists: {pr_url}")
+        return pr_url
 
     # Create new PR
     print("  Creating new PR...")
     result = run_command(
-        f'gh pr create --title "[python] release new version" --body "" --base {base_branch}', cwd=repo_path
+        ["gh", "pr", "create", "--title", "[python] release new version", "--body", "", "--base", base_branch],
+        cwd=repo_path,
     )
     print("  PR created successfully!")
 
-    # Extract PR URL from output
+    # Extract PR URL from output: gh prints it on stdout, so only fall back to stderr if stdout has none
     pr_url = None
-    output = result.stdout + result.stderr
-    url_match = re.search(r"https://github\.com/[^\s]+/pull/\d+", output)
+    url_match = _PR_URL_RE.search(result.stdout) or _PR_URL_RE.search(result.stderr)
     if url_match:
         pr_url = url_match.group(0)
 
@@ -475,6 +657,7 @@ examples:
   python typespec_python_release.py <path_to_autorest_python_repo> --skip-pr
   python typespec_python_release.py <path_to_autorest_python_repo> --skip-build
   python typespec_python_release.py <path_to_autorest_python_repo> --no-gui
+  python typespec_python_release.py <path_to_autorest_python_repo> --no-cache
   python typespec_python_release.py C:\\dev\\autorest.python --base-branch my-feature-branch
 """,
     )
@@ -485,7 +668,10 @@ examples:
     )
     parser.add_argument("--skip-pr", action="store_true", help="Skip creating the PR (useful for testing)")
     parser.add_argument("--skip-build", action="store_true", help="Skip the build step (useful for testing)")
-    parser.add_argument("--no-gui", action="store_true", help="Disable GUI popup (for automated/headless usage)")
+    parser.add_argument(
+        "--no-gui", action="store_true", help="Don't open the PR in a browser (for automated/headless usage)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached npm registry versions and refetch them")
 
     args = parser.parse_args()
 
@@ -493,71 +679,103 @@ examples:
     base_branch = args.base_branch
     current_date = args.date or datetime.now().strftime("%Y-%m-%d")
 
-    if not repo_path.exists():
-        print(f"Error: Repository path does not exist: {repo_path}", file=sys.stderr)
-        sys.exit(1)
-
-    # Verify expected directories exist
-    autorest_dir = repo_path / "packages" / "autorest.python"
-    typespec_dir = repo_path / "packages" / "typespec-python"
-
-    if not autorest_dir.exists():
-        print(f"Error: autorest.python package directory not found: {autorest_dir}", file=sys.stderr)
-        sys.exit(1)
-
-    if not typespec_dir.exists():
-        print(f"Error: typespec-python package directory not found: {typespec_dir}", file=sys.stderr)
-        sys.exit(1)
+    # Verify the repository, package directories and package files exist, once and up front
+    autorest_dir = repo_path / AUTOREST_DIR
+    typespec_dir = repo_path / TYPESPEC_DIR
+    autorest_package_file = autorest_dir / "package.json"
+    typespec_package_file = typespec_dir / "package.json"
+
+    required_paths = [
+        (repo_path, "Repository path does not exist"),
+        (autorest_dir, "autorest.python package directory not found"),
+        (typespec_dir, "typespec-python package directory not found"),
+        (autorest_package_file, "Package file not found"),
+        (typespec_package_file, "Package file not found"),
+    ]
+    for path, error in required_paths:
+        if not path.exists():
+            print(f"Error: {error}: {path}", file=sys.stderr)
+            sys.exit(1)
 
     print(f"Repository path: {repo_path}")
     print(f"Base branch: {base_branch}")
     print(f"Current date: {current_date}")
 
+    if args.no_cache:
+        global _read_cached_npm_versions
+        _read_cached_npm_versions = False
+
+    # Resolve the registry versions needed by steps 2a and 4 in the background while the branch is prepared,
+    # so their network latency overlaps with the git work instead of adding to it. If an earlier step fails, the
+    # interpreter still waits for an in-flight prefetch on exit; each registry request is bounded by its 30 s timeout
+    prefetch_names = ["@typespec/http-client-python"]
+    if base_branch == "main":
+        try:
+            peer_deps = _json_loads(typespec_package_file.read_bytes()).get("peerDependencies", {})
+            prefetch_names += _updatable_peer_dependencies(peer_deps)
+        except (OSError, ValueError):
+            pass
+    prefetch_executor = ThreadPoolExecutor(max_workers=1)
+    prefetch = prefetch_executor.submit(_fetch_latest_versions, prefetch_names)
+
+    git = GitRunner(repo_path)
+
     try:
         # Prerequisites check
         if base_branch == "main":
             check_prerequisites()
 
         # Step 1: Prepare branch
-        prepare_branch(repo_path, base_branch, current_date)
+        prepare_branch(git, base_branch, current_date)
 
-        # Step 2: Get latest version and update dependencies
+        # Step 2: Get latest version and update dependencies; the prefetch leaves its results in the version cache.
+        # It is only an optimization, so if it failed the lookups below simply resolve each package themselves
+        try:
+            prefetch.result()
+        except Exception as e:
+            print(f"\n  Warning: prefetching npm versions failed ({e}); resolving them individually")
+        prefetch_executor.shutdown()
         version = get_latest_npm_version("@typespec/http-client-python")
-        update_http_client_python_dependency(repo_path, version)
+        update_http_client_python_dependency(repo_path, [autorest_package_file, typespec_package_file], version)
 
         # Steps 3-5: Update dependencies (only if BASE_BRANCH is "main")
         if base_branch == "main":
-            saved_dev_deps = save_spec_dev_dependencies(repo_path)
+            saved_dev_deps = save_spec_dev_dependencies(typespec_package_file)
             update_typespec_dependencies(repo_path)
-            update_peer_dependencies(repo_path)
-            verify_spec_dev_dependencies(repo_path, saved_dev_deps)
+            # ncu rewrites package.json on disk, so load it only afterwards; steps 4-5 share one parse and one write
+            package_json = PackageJsonCache(typespec_package_file)
+            update_peer_dependencies(package_json)
+            verify_spec_dev_dependencies(package_json, saved_dev_deps)
+            package_json.save()
 
         # Step 6: Run version tool
-        run_version_tool(repo_path)
+        needs_minor_bump = run_version_tool(repo_path, git)
 
         # Step 7: Check for minor version bump
-        check_and_fix_minor_version(repo_path)
+        check_and_fix_minor_version(repo_path, needs_minor_bump)
 
         # Step 8: Build and stage
         if args.skip_build:
             print("\n[Step 8] Skipping build (--skip-build flag)")
-            run_command("git add -u", cwd=repo_path)
+            git.run("add", "-u")
         else:
-            build_and_stage(repo_path)
+            build_and_stage(repo_path, git)
 
         # Step 9: Commit and push
-        commit_and_push(repo_path)
+        commit_and_push(git)
 
         # Step 10: Create PR
         if args.skip_pr:
             print("\n[Step 10] Skipping PR creation (--skip-pr flag)")
         else:
             pr_url = create_pr_if_needed(repo_path, base_branch)
+            # Skip opening a browser in CI or when output is not an interactive terminal
+            headless = args.no_gui or os.environ.get("NO_GUI") or os.environ.get("CI") or not sys.stdout.isatty()
             if pr_url:
-                if args.no_gui or os.environ.get("NO_GUI"):
+                if headless:
                     print(f"\n  PR URL: {pr_url}")
                 else:
-                    show_pr_link_window(pr_url)
+                    show_pr_link(pr_url)
 
         print("\n" + "=" * 50)
         print("Bump and release workflow completed successfully!")
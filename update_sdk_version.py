@@ -8,20 +8,20 @@ package based on a PR link, then commits and pushes to the PR branch.
 
 import argparse
 import json
+import os
 import re
 import subprocess
 import sys
 from pathlib import Path
 
+# Suppress the console window flash for each spawned process on Windows
+CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
 
-def run_command(cmd: str | list[str], cwd: str | Path | None = None, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
-    if isinstance(cmd, str):
-        print(f"  Running: {cmd}")
-        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
-    else:
-        print(f"  Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+
+def run_command(cmd: list[str], cwd: str | Path | None = None, check: bool = True) -> subprocess.CompletedProcess:
+    """Run a command directly (no intermediate shell) and return the result."""
+    print(f"  Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, creationflags=CREATIONFLAGS)
 
     if result.stdout:
         print(result.stdout.rstrip())
@@ -38,11 +38,11 @@ def reset_and_sync(repo_path: Path) -> None:
     """Reset local changes and sync with main branch."""
     print("\n[Step 1] Resetting and syncing with main...")
 
-    run_command("git reset HEAD", cwd=repo_path, check=False)
-    run_command("git checkout .", cwd=repo_path)
-    run_command("git clean -fd", cwd=repo_path)
-    run_command("git checkout origin/main", cwd=repo_path)
-    run_command("git pull origin main", cwd=repo_path)
+    # A forced checkout discards staged and unstaged changes while moving to the freshly fetched main.
+    # -B resets local main to origin/main, so any unpushed commits on local main are dropped
+    run_command(["git", "fetch", "--prune", "origin", "main"], cwd=repo_path)
+    run_command(["git", "checkout", "--force", "-B", "main", "origin/main"], cwd=repo_path)
+    run_command(["git", "clean", "-fd"], cwd=repo_path)
 
 
 def parse_pr_link(pr_link: str) -> tuple[str, str, int]:
@@ -62,7 +62,7 @@ def checkout_pr(repo_path: Path, pr_link: str, owner: str, repo: str) -> tuple[s
 
     # Get PR branch info including fork details
     result = run_command(
-        f"gh pr view {pr_link} --json headRefName,headRepositoryOwner",
+        ["gh", "pr", "view", pr_link, "--json", "headRefName,headRepositoryOwner"],
         cwd=repo_path,
     )
     pr_info = json.loads(result.stdout)
@@ -72,16 +72,16 @@ def checkout_pr(repo_path: Path, pr_link: str, owner: str, repo: str) -> tuple[s
     if head_owner.lower() != owner.lower():
         # PR is from a fork — add fork owner as remote if not already present
         fork_url = f"https://github.com/{head_owner}/{repo}.git"
-        remotes_result = run_command("git remote", cwd=repo_path)
+        remotes_result = run_command(["git", "remote"], cwd=repo_path)
         if head_owner not in remotes_result.stdout.strip().splitlines():
-            run_command(f"git remote add {head_owner} {fork_url}", cwd=repo_path)
+            run_command(["git", "remote", "add", head_owner, fork_url], cwd=repo_path)
         remote = head_owner
     else:
         remote = "origin"
 
-    run_command(f"git fetch {remote} {branch}", cwd=repo_path)
-    run_command(f"git checkout {branch}", cwd=repo_path)
-    run_command(f"git pull {remote} {branch}", cwd=repo_path)
+    run_command(["git", "fetch", remote, branch], cwd=repo_path)
+    run_command(["git", "checkout", branch], cwd=repo_path)
+    run_command(["git", "pull", remote, branch], cwd=repo_path)
 
     print(f"  Checked out branch: {branch}")
     return branch, remote
@@ -92,7 +92,7 @@ def get_pr_files(repo_path: Path, owner: str, repo: str, pr_number: int) -> list
     print(f"\n[Step 3] Getting files changed in PR #{pr_number}...")
 
     result = run_command(
-        f'gh pr view {pr_number} --repo {owner}/{repo} --json files --jq ".files[].path"',
+        ["gh", "pr", "view", str(pr_number), "--repo", f"{owner}/{repo}", "--json", "files", "--jq", ".files[].path"],
         cwd=repo_path,
     )
     files = [f.strip() for f in result.stdout.strip().splitlines() if f.strip()]
@@ -235,19 +235,19 @@ def commit_and_push(repo_path: Path, sdk_folder: str, new_version: str, remote:
     """Stage, commit, and push the changes."""
     print(f"\n[Step 8] Committing and pushing changes...")
 
-    run_command(f"git add {sdk_folder}", cwd=repo_path)
+    run_command(["git", "add", sdk_folder], cwd=repo_path)
 
     # Check if there are staged changes
-    result = run_command("git diff --cached --quiet", cwd=repo_path, check=False)
+    result = run_command(["git", "diff", "--cached", "--quiet"], cwd=repo_path, check=False)
     if result.returncode == 0:
         print("  No changes to commit")
         return
 
     package_name = sdk_folder.split("/")[-1]
     commit_msg = f"update {package_name} version to {new_version}"
-    run_command(f'git commit -m "{commit_msg}"', cwd=repo_path)
+    run_command(["git", "commit", "-m", commit_msg], cwd=repo_path)
 
-    run_command(f"git push {remote} HEAD", cwd=repo_path)
+    run_command(["git", "push", remote, "HEAD"], cwd=repo_path)
 
     print("  Changes pushed successfully")
 